@@ -1,59 +1,117 @@
+import html
 import os
 import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from urllib.parse import urlencode
 
 import streamlit as st
 from dotenv import load_dotenv
+from streamlit.errors import StreamlitAPIException
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 from search_movie import (
     search_movie,
     get_movie_details,
-    get_recommendations,
+    get_movie_details_with_recs,
     get_trending,
     get_popular,
     get_top_rated,
+    get_backdrop_url,
+    get_poster_url_large,
+    enrich_movie,
 )
+from styles import GLOBAL_CSS
 
 # -------------------------------------------------
 # Setup
 # -------------------------------------------------
 load_dotenv()
 
+MY_LIST_DB = Path("my_list.db")
+# Legacy JSON store, imported once into the database if present
 MY_LIST_FILE = Path("my_list.json")
 
 
+@st.cache_resource
+def get_my_list_lock() -> threading.Lock:
+    """Serialises use of the shared connection across sessions, so one
+    session's `with conn:` cannot commit or roll back another's statement."""
+    return threading.Lock()
+
+
+@st.cache_resource
+def get_my_list_db() -> sqlite3.Connection:
+    """One shared SQLite connection per process (not per rerun)."""
+    conn = sqlite3.connect(MY_LIST_DB, check_same_thread=False)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS my_list (id INTEGER PRIMARY KEY, added_at REAL)"
+    )
+    # user_version marks the one-shot JSON import as done, so a list the
+    # user has emptied is not refilled from the old file on the next start
+    migrated = conn.execute("PRAGMA user_version").fetchone()[0] >= 1
+    if not migrated:
+        legacy = []
+        if MY_LIST_FILE.exists():
+            try:
+                legacy = json.loads(MY_LIST_FILE.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                legacy = []
+        with get_my_list_lock(), conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO my_list (id, added_at) VALUES (?, ?)",
+                [(mid, i) for i, mid in enumerate(legacy)],
+            )
+            conn.execute("PRAGMA user_version = 1")
+    return conn
+
+
 def load_my_list_from_disk() -> list:
-    if MY_LIST_FILE.exists():
-        try:
-            return json.loads(MY_LIST_FILE.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
-            return []
-    return []
+    try:
+        conn = get_my_list_db()
+        with get_my_list_lock():
+            rows = conn.execute("SELECT id FROM my_list ORDER BY added_at")
+            return [r[0] for r in rows]
+    except sqlite3.Error:
+        return []
 
 
-def save_my_list_to_disk(mylist: list) -> None:
+def _write_my_list(sql: str, params: tuple) -> None:
     try:
-        MY_LIST_FILE.write_text(json.dumps(mylist), encoding="utf-8")
-    except OSError:
+        conn = get_my_list_db()
+        with get_my_list_lock(), conn:
+            conn.execute(sql, params)
+    except sqlite3.Error:
         # If something goes wrong writing to disk, just ignore
         pass
 
 
-# Helpers to modify `st.session_state.my_list` and persist immediately
+# Helpers to modify `st.session_state.my_list` and persist immediately.
+# `my_list_set` mirrors the list for O(1) membership; the list keeps order.
+# Each change is a single-row INSERT/DELETE rather than a full rewrite.
 def add_to_my_list(movie_id: int) -> None:
     if movie_id is None:
         return
-    if movie_id not in st.session_state.my_list:
-        st.session_state.my_list.append(movie_id)
-        save_my_list_to_disk(st.session_state.my_list)
+    if movie_id in st.session_state.my_list_set:
+        return
+    st.session_state.my_list_set.add(movie_id)
+    st.session_state.my_list.append(movie_id)
+    _write_my_list(
+        "INSERT OR IGNORE INTO my_list (id, added_at) VALUES (?, ?)",
+        (movie_id, time.time()),
+    )
 
 
 def remove_from_my_list(movie_id: int) -> None:
-    if movie_id is None:
+    if movie_id not in st.session_state.my_list_set:
         return
-    st.session_state.my_list = [mid for mid in st.session_state.my_list if mid != movie_id]
-    save_my_list_to_disk(st.session_state.my_list)
+    st.session_state.my_list_set.discard(movie_id)
+    st.session_state.my_list.remove(movie_id)
+    _write_my_list("DELETE FROM my_list WHERE id = ?", (movie_id,))
 
 
 
@@ -73,91 +131,177 @@ def safe_rerun():
         st.experimental_rerun()
 
 
+def rerun_fragment():
+    """Rerun only the enclosing `st.fragment`, not the whole script."""
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        # Only allowed during a fragment rerun; fall back to a full rerun
+        safe_rerun()
+
+
 # -------------------------------------------------
-# Small helpers
+# TMDb fetch helpers (the endpoints themselves are cached in search_movie.py)
 # -------------------------------------------------
-def get_poster_url(path: Optional[str]) -> str:
-    if path:
-        return f"https://image.tmdb.org/t/p/w500{path}"
-    return (
-        "https://www.themoviedb.org/assets/2/v4/logos/"
-        "stacked-blue-2b2b2b9ef3c2a132.png"
-    )
+@st.cache_resource
+def get_fetch_pool() -> ThreadPoolExecutor:
+    """Thread pool shared by all sessions for overlapping TMDb requests."""
+    return ThreadPoolExecutor(max_workers=8)
+
+
+@st.cache_resource
+def get_prefetch_pool() -> ThreadPoolExecutor:
+    """Small separate pool for background prefetches, so they never queue
+    ahead of the fetches a script run is blocked on."""
+    return ThreadPoolExecutor(max_workers=2)
+
+
+def submit_fetch(fn, *args, pool: Optional[ThreadPoolExecutor] = None) -> Future:
+    """Run `fn(*args)` on a pool (default: the shared one) with this script
+    run's context.
+
+    Pool threads have no ScriptRunContext of their own, and without one the
+    `st.cache_data` endpoints neither read nor write the cache.
+    """
+    ctx = get_script_run_ctx()
 
+    def run():
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return fn(*args)
+
+    return (pool or get_fetch_pool()).submit(run)
+
+
+def fetch_discovery_lists() -> Tuple[List[Dict], List[Dict], List[Dict]]:
+    """Fetch trending, popular and top rated concurrently."""
+    futures = [submit_fetch(fn) for fn in (get_trending, get_popular, get_top_rated)]
+    trending, popular, top_rated = (f.result() for f in futures)
+    return trending, popular, top_rated
+
+
+def prefetch_details(movies: List[Dict], n: int = 5) -> None:
+    """Warm the modal's details fetch for the first few cards, without waiting.
+
+    Each id is submitted once per session; the futures are kept in
+    `st.session_state.prefetched` keyed by movie id.
+    """
+    if "prefetched" not in st.session_state:
+        st.session_state.prefetched = {}
+    prefetched = st.session_state.prefetched
+    for m in movies[:n]:
+        mid = m.get("id")
+        if mid is not None and mid not in prefetched:
+            prefetched[mid] = submit_fetch(
+                get_movie_details_with_recs, mid, pool=get_prefetch_pool()
+            )
 
-def get_backdrop_url(movie: Dict) -> str:
-    backdrop = movie.get("backdrop_path")
-    poster = movie.get("poster_path")
-    if backdrop:
-        return f"https://image.tmdb.org/t/p/original{backdrop}"
-    if poster:
-        return f"https://image.tmdb.org/t/p/original{poster}"
+
+def fetch_details_parallel(ids: List[int]) -> List[Dict]:
+    """Fetch details for many ids concurrently, dropping empty results."""
+    futures = [submit_fetch(get_movie_details, mid) for mid in ids]
+    return [d for d in (f.result() for f in futures) if d]
+
+
+# -------------------------------------------------
+# Small helpers
+# -------------------------------------------------
+def movie_href(movie_id) -> str:
+    """Link that opens a movie's modal, carrying the current ?q= search along.
+
+    Card links are full page loads (a new session), so the search query has
+    to travel in the URL for ← to land back on the results.
+    """
+    params = {"movie": movie_id}
+    q = st.query_params.get("q")
+    if q:
+        params["q"] = q
+    return "?" + html.escape(urlencode(params))
+
+
+def _card_fields(m: Dict) -> tuple:
+    """Hashable (href, title, poster, rating, year) for one card."""
+    if "_poster" not in m:
+        enrich_movie(m)
+    movie_id = m.get("id")
+    # if movie_id is missing, just don't make it a link
+    href = movie_href(movie_id) if movie_id is not None else "#"
     return (
-        "https://www.themoviedb.org/assets/2/v4/logos/"
-        "stacked-blue-2b2b2b9ef3c2a132.png"
+        href,
+        m["_title_html"],
+        m["_poster"],
+        m.get("vote_average", "N/A"),
+        m["_year"],
     )
 
 
-def truncate(text: Optional[str], n: int = 240) -> str:
-    if not text:
-        return ""
-    if len(text) <= n:
-        return text
-    return text[:n].rstrip() + "..."
-
-
-def render_row_html(row_title: str, movies: List[Dict]) -> str:
-    cards_html_parts = []
-    for m in movies:
-        if (not m.get("poster_path")) and (m.get("vote_average", 0) == 0):
-            continue
-
-        poster = get_poster_url(m.get("poster_path"))
-        title = m.get("title", "Untitled")
-        year = (m.get("release_date") or "")[:4]
-        rating = m.get("vote_average", "N/A")
-        movie_id = m.get("id")
-
-        # if movie_id is missing, just don't make it a link
-        href = f"?movie={movie_id}" if movie_id is not None else "#"
-
-        card_html = (
-            f'<a class="nm-card-link" href="{href}">'     # <-- NEW
-            '<div class="nm-card">'
-            '<div class="nm-card-inner">'
-            f'<img src="{poster}" class="nm-card-img" alt="{title} poster"/>'
-            '<div class="nm-card-info">'
-            f'<div class="nm-card-title">{title}</div>'
-            f'<div class="nm-card-meta">⭐ {rating} · {year}</div>'
-            "</div>"
-            "</div>"
-            "</div>"
-            "</a>"                                        # <-- NEW
-        )
-        cards_html_parts.append(card_html)
-
-    cards_html = "".join(cards_html_parts)
-    row_html = (
+# Posters below the fold load lazily; the first cards of the top row don't
+_LAZY_IMG_ATTRS = ' loading="lazy" fetchpriority="low"'
+EAGER_CARDS = 6
+
+
+# Bounded: search rows produce a new key per query
+@st.cache_data(show_spinner=False, max_entries=256)
+def _render_row_html_cached(row_title: str, cards: tuple) -> str:
+    cards_html = "".join(
+        f'<a class="nm-card-link" href="{href}" target="_self">'
+        '<div class="nm-card"><div class="nm-card-inner">'
+        f'<img src="{poster}" class="nm-card-img" alt="{title} poster" '
+        'width="180" height="260" decoding="async"'
+        f'{"" if eager else _LAZY_IMG_ATTRS}/>'
+        '<div class="nm-card-info">'
+        f'<div class="nm-card-title">{title}</div>'
+        f'<div class="nm-card-meta">⭐ {rating} · {year}</div>'
+        "</div></div></div></a>"
+        for (href, title, poster, rating, year), eager in cards
+    )
+    return (
         '<section class="nm-row">'
         f'<div class="nm-row-header">{row_title}</div>'
         f'<div class="nm-row-scroll">{cards_html}</div>'
         "</section>"
     )
-    return row_html
 
 
+def render_row_html(row_title: str, movies: List[Dict], eager: int = 0) -> str:
+    """Row HTML; the first `eager` posters skip lazy loading (top row only)."""
+    shown = [
+        m for m in movies if m.get("poster_path") or m.get("vote_average", 0) != 0
+    ]
+    cards = tuple((_card_fields(m), i < eager) for i, m in enumerate(shown))
+    # Fast path: a per-session dict keyed by the full card fields, so an
+    # unchanged row skips st.cache_data's hashing and copy-on-hit, while a
+    # refreshed title or rating still produces a new key
+    key = (row_title, cards)
+    if "row_cache" not in st.session_state:
+        st.session_state.row_cache = {}
+    row_cache = st.session_state.row_cache
+    if key in row_cache:
+        return row_cache[key]
+
+    # Rows with identical cards reuse the memoized HTML across sessions
+    row_html = _render_row_html_cached(row_title, cards)
+    if len(row_cache) >= 64:
+        row_cache.clear()
+    row_cache[key] = row_html
+    return row_html
+
 
+@st.fragment
 def render_modal(details: Dict, recs: List[Dict]) -> None:
-    """Full‐screen modal for 'More Info'."""
-    title = details.get("title", "Untitled")
-    year = (details.get("release_date") or "N/A")[:4]
+    """Full‐screen modal for 'More Info'.
+
+    Runs as a fragment so the My List toggle only reruns the modal.
+    """
+    if "_title_html" not in details:
+        enrich_movie(details)
+    title = details["_title_html"]
+    year = details["_year"] or "N/A"
     rating = details.get("vote_average", "N/A")
 
-    genres_list = details.get("genres", [])
-    genres = ", ".join([g.get("name", "") for g in genres_list]) or "N/A"
+    genres = details["_genres_html"] or "N/A"
 
-    overview = details.get("overview", "No description available.")
-    poster_big = get_poster_url(details.get("poster_path"))
+    overview = details["_overview_html"] or "No description available."
+    poster_big = get_poster_url_large(details.get("poster_path"))
 
     recs_html_block = ""
     if recs:
@@ -183,11 +327,10 @@ def render_modal(details: Dict, recs: List[Dict]) -> None:
     # Top-left back arrow (inside app)
     st.markdown('<div class="nm-modal-back-top">', unsafe_allow_html=True)
     if st.button("←", key="back_modal"):
-        # Clear selection in state
-        st.session_state.selected_movie_id = None
-        # Remove ?movie= from the URL so browser Back also works
-        # clear all query params (removes ?movie=...)
-        st.query_params = {}
+        # Only drop ?movie= from the URL (?q= keeps the search); the URL ->
+        # state sync at the top of the script resets selected_movie_id on
+        # the single rerun
+        del st.query_params["movie"]
         safe_rerun()
     st.markdown("</div>", unsafe_allow_html=True)
 
@@ -197,7 +340,7 @@ def render_modal(details: Dict, recs: List[Dict]) -> None:
     # Add / Remove from My List button, aligned under description
     st.markdown('<div class="nm-modal-add">', unsafe_allow_html=True)
     movie_id = details.get("id")
-    in_list = movie_id in st.session_state.my_list if movie_id is not None else False
+    in_list = movie_id in st.session_state.my_list_set
     label = "Remove from My List" if in_list else "Add to My List"
     if st.button(label, key=f"toggle_mylist_{movie_id}"):
         if movie_id is not None:
@@ -206,11 +349,38 @@ def render_modal(details: Dict, recs: List[Dict]) -> None:
             else:
                 add_to_my_list(movie_id)
 
-            safe_rerun()
+            rerun_fragment()
 
     st.markdown("</div>", unsafe_allow_html=True)
 
 
+@st.fragment
+def render_my_list_row() -> None:
+    """'My List' row with Remove buttons; removing reruns only this row."""
+    if not st.session_state.my_list:
+        return
+    # Details and row HTML are both cached already, so a rerun here costs
+    # cache lookups only; failed lookups are retried on the next run
+    saved_movies = fetch_details_parallel(st.session_state.my_list)
+    if saved_movies:
+        st.markdown(
+            render_row_html("My List", saved_movies, eager=EAGER_CARDS),
+            unsafe_allow_html=True,
+        )
+        # Add Remove buttons beneath each poster so users can remove items directly from My List
+        # Layout uses 6 columns to match the poster grid width
+        remove_cols = st.columns(6)
+        for i, m in enumerate(saved_movies):
+            mid = m.get("id")
+            if mid is None:
+                continue
+            with remove_cols[i % 6]:
+                if st.button("Remove", key=f"remove-{mid}"):
+                    # Remove and persist immediately, then rerun to refresh the row
+                    remove_from_my_list(mid)
+                    rerun_fragment()
+
+
 # -------------------------------------------------
 # Page & session setup
 # -------------------------------------------------
@@ -218,6 +388,7 @@ st.set_page_config(page_title="Netflix Explorer", layout="wide")
 
 if "my_list" not in st.session_state:
     st.session_state.my_list = load_my_list_from_disk()
+    st.session_state.my_list_set = set(st.session_state.my_list)
 
 if "selected_movie_id" not in st.session_state:
     st.session_state.selected_movie_id = None
@@ -251,370 +422,18 @@ else:
     # No ?movie= in URL → no modal
     st.session_state.selected_movie_id = None
 
+# Restore the search from ?q= when a card link started a new session
+if "q" in qp and "search_box" not in st.session_state:
+    st.session_state.search_box = qp["q"]
+
 # -------------------------------------------------
 # Global styles
 # -------------------------------------------------
-st.markdown(
-    """
-<style>
-@import url('https://fonts.googleapis.com/css2?family=Poppins:wght@400;500;600;700&display=swap');
-
-:root {
-    --bg-page: #000;
-    --bg-nav: #141414;
-    --accent: #E50914;
-    --text-main: #fff;
-    --text-dim: #b3b3b3;
-    --row-gap: 1rem;
-    --radius-card: 8px;
-    --radius-modal: 12px;
-    --font-main: 'Poppins', sans-serif;
-}
-
-body, .stApp {
-    background-color: var(--bg-page);
-    color: var(--text-main);
-    font-family: var(--font-main);
-    margin: 0;
-    padding: 0;
-}
-
-/* NAVBAR */
-.nm-nav {
-    position: fixed;
-    top: 0;
-    left: 0;
-    right: 0;
-    height: 64px;
-    background-color: var(--bg-nav);
-    display: flex;
-    align-items: center;
-    padding: 0 2rem;
-    z-index: 1000;
-    box-shadow: 0 20px 40px rgba(0,0,0,0.8);
-}
-.nm-logo {
-    color: var(--accent);
-    font-weight: 700;
-    font-size: 1.4rem;
-    letter-spacing: -0.02em;
-    text-shadow: 0 0 20px rgba(229,9,20,0.6);
-    margin-right: 2rem;
-}
-.nm-links {
-    display: flex;
-    gap: 1.2rem;
-    font-size: 0.9rem;
-    font-weight: 500;
-}
-.nm-links div {
-    color: #e6e6e6;
-    cursor: pointer;
-}
-.nm-links div:hover {
-    color: var(--text-main);
-    text-shadow: 0 0 10px rgba(255,255,255,0.4);
-}
-
-/* CONTENT WRAPPER */
-.nm-content {
-    padding-top: 64px;
-    position: relative;
-    z-index: 1;
-}
-
-/* HERO */
-.nm-hero {
-    position: relative;
-    width: 100%;
-    height: 55vh;
-    min-height: 420px;
-    max-height: 620px;
-    background-size: cover;
-    background-position: center center;
-    display: flex;
-    align-items: flex-end;
-    box-shadow: 0 60px 120px rgba(0,0,0,0.9);
-}
-.nm-hero-gradient {
-    width: 100%;
-    height: 100%;
-    background:
-        radial-gradient(circle at 20% 30%, rgba(0,0,0,0) 0%, rgba(0,0,0,0.6) 60%),
-        linear-gradient(180deg, rgba(0,0,0,0) 0%, rgba(0,0,0,0.8) 70%, rgba(0,0,0,1) 100%);
-    display: flex;
-    align-items: flex-end;
-}
-.nm-hero-inner {
-    padding: 2rem 2rem 3rem 2rem;
-    max-width: 60%;
-    color: var(--text-main);
-    text-shadow: 0 2px 12px rgba(0,0,0,0.95);
-}
-.nm-hero-title {
-    font-size: clamp(1.8rem, 1.2vw + 1rem, 2.6rem);
-    font-weight: 700;
-    line-height: 1.15;
-    margin: 0 0 0.6rem 0;
-}
-.nm-hero-desc {
-    font-size: 0.95rem;
-    line-height: 1.5;
-    color: var(--text-dim);
-    margin: 0 0 1rem 0;
-}
-
-/* ROW / CAROUSEL */
-.nm-row {
-    margin-top: 2rem;
-    padding-left: 2rem;
-    padding-right: 2rem;
-}
-.nm-row-header {
-    color: var(--text-main);
-    font-size: 1.1rem;
-    font-weight: 600;
-    margin-bottom: 0.5rem;
-    text-shadow: 0 2px 8px rgba(0,0,0,0.8);
-}
-.nm-row-scroll {
-    display: flex;
-    flex-wrap: nowrap;
-    overflow-x: auto;
-    gap: var(--row-gap);
-    padding-bottom: 1rem;
-    scrollbar-width: thin;
-    scrollbar-color: var(--accent) rgba(255,255,255,0.05);
-}
-.nm-row-scroll::-webkit-scrollbar {
-    height: 8px;
-}
-.nm-row-scroll::-webkit-scrollbar-thumb {
-    background: var(--accent);
-    border-radius: 999px;
-}
-
-/* CARD */
-.nm-card {
-    flex: 0 0 auto;
-    width: 180px;
-    border-radius: var(--radius-card);
-    box-shadow: 0 30px 60px rgba(0,0,0,0.9);
-    transition: all 0.25s ease;
-    cursor: pointer;
-    background-color: #000;
-    position: relative;
-}
-.nm-card-inner {
-    background-color: #000;
-    border-radius: var(--radius-card);
-    overflow: hidden;
-    border: 1px solid rgba(255,255,255,0.07);
-    box-shadow: 0 18px 40px rgba(0,0,0,0.75);
-}
-.nm-card-link {
-    text-decoration: none;
-    color: inherit;
-    display: inline-block;
-}
-.nm-card:hover {
-    transform: scale(1.07);
-    box-shadow: 0 40px 120px rgba(229,9,20,0.6);
-}
-.nm-card-img {
-    width: 100%;
-    height: 260px;
-    object-fit: cover;
-    display: block;
-    background-color: #111;
-}
-.nm-card-info {
-    padding: 0.6rem 0.75rem 0.9rem 0.75rem;
-    background: linear-gradient(
-        180deg,
-        rgba(0,0,0,0) 0%,
-        rgba(0,0,0,0.7) 60%,
-        rgba(0,0,0,1) 100%
-    );
-    min-height: 70px;
-}
-.nm-card-title {
-    font-size: 0.8rem;
-    font-weight: 600;
-    color: var(--text-main);
-    line-height: 1.3;
-    text-shadow: 0 2px 6px rgba(0,0,0,0.9);
-}
-.nm-card-meta {
-    color: var(--text-dim);
-    font-size: 0.7rem;
-    margin-top: 0.25rem;
-    font-weight: 500;
-}
-
-/* MODAL */
-.nm-modal-backdrop {
-    background: rgba(0,0,0,0.8);
-    border-radius: 12px;
-    margin: 2rem auto;
-    padding: 2rem 1.5rem 2.5rem 1.5rem;
-    max-width: 960px;
-    display: flex;
-    flex-direction: column;
-    align-items: center;
-}
-.nm-modal-card {
-    width: min(900px, 90%);
-    border-radius: var(--radius-modal);
-    background:
-        radial-gradient(circle at 20% 20%, rgba(255,255,255,0.07) 0%, rgba(0,0,0,0) 60%),
-        rgba(20,20,20,0.9);
-    border: 1px solid rgba(255,255,255,0.08);
-    box-shadow: 0 60px 160px rgba(0,0,0,1);
-    display: flex;
-    flex-wrap: wrap;
-    padding: 1.5rem 1.5rem 0.5rem 1.5rem;
-    color: var(--text-main);
-}
-.nm-modal-left {
-    flex: 0 0 200px;
-    max-width: 200px;
-    margin-right: 1.5rem;
-}
-.nm-modal-poster {
-    width: 100%;
-    border-radius: var(--radius-card);
-    box-shadow: 0 30px 80px rgba(229,9,20,0.4);
-    border: 1px solid rgba(255,255,255,0.15);
-}
-.nm-modal-right {
-    flex: 1 1 auto;
-    min-width: 200px;
-}
-.nm-modal-title {
-    font-weight: 700;
-    font-size: 1.3rem;
-    line-height: 1.3;
-    color: var(--text-main);
-    text-shadow: 0 2px 8px rgba(0,0,0,0.8);
-}
-.nm-modal-year {
-    color: var(--text-dim);
-    font-weight: 500;
-    font-size: 0.9rem;
-}
-.nm-modal-stats {
-    font-size: 0.9rem;
-    color: var(--text-dim);
-    margin-top: 0.4rem;
-    margin-bottom: 0.8rem;
-}
-.nm-modal-overview {
-    font-size: 0.9rem;
-    line-height: 1.5;
-    color: #e5e5e5;
-    text-shadow: 0 2px 8px rgba(0,0,0,1);
-}
-.nm-modal-recs {
-    width: min(900px, 90%);
-    margin-top: 2rem;
-}
-
-/* Back arrow container */
-.nm-modal-back-top {
-    width: min(900px, 90%);
-    margin: 1.2rem auto 0 auto;
-    display: flex;
-    justify-content: flex-start;
-}
-.nm-modal-back-top .stButton {
-    display: inline-flex;
-}
-.nm-modal-back-top .stButton > button {
-    width: 40px;
-    height: 40px;
-    padding: 0 !important;
-    border-radius: 999px !important;
-    background: rgba(0,0,0,0.75) !important;
-    border: 1px solid rgba(255,255,255,0.25) !important;
-    font-size: 1.2rem !important;
-    font-weight: 600 !important;
-    line-height: 1 !important;
-}
-
-/* Add button under description */
-.nm-modal-add {
-    width: min(900px, 90%);
-    margin: -0.25rem auto 0 auto;
-    padding: 0 1.5rem 1.5rem 1.5rem;
-    display: flex;
-    justify-content: flex-start;
-}
-.nm-modal-add .stButton {
-    margin-left: 230px; /* ≈ poster width (200) + gap (30) */
-}
-.nm-modal-add .stButton > button {
-    background: linear-gradient(135deg, #e50914, #f40612) !important;
-    border-radius: 999px !important;
-    font-weight: 600 !important;
-    letter-spacing: 0.02em;
-}
-
-/* Search bar */
-.stTextInput > div > div > input {
-    background-color: #1a1a1a !important;
-    color: var(--text-main) !important;
-    border-radius: 6px !important;
-    border: 1px solid #333 !important;
-    padding: 10px 12px !important;
-    font-size: 0.9rem !important;
-    font-weight: 500 !important;
-    box-shadow: 0 20px 40px rgba(0,0,0,0.8);
-}
-.stTextInput > div > div > input:focus {
-    border: 1px solid var(--accent) !important;
-    outline: 2px solid var(--accent) !important;
-    box-shadow: 0 0 20px rgba(229,9,20,0.7) !important;
-}
-
-/* Global button style */
-.stButton>button {
-    background: var(--accent) !important;
-    color: #fff !important;
-    border: 0 !important;
-    border-radius: 6px !important;
-    font-weight: 600 !important;
-    padding: 0.6rem 1rem !important;
-    box-shadow: 0 20px 60px rgba(229,9,20,0.5) !important;
-    cursor: pointer !important;
-}
-.stButton>button:hover {
-    box-shadow: 0 30px 80px rgba(229,9,20,0.8) !important;
-}
-.nm-link {
-    padding: 0 0.75rem;
-    color: #e6e6e6;
-    font-size: 0.9rem;
-    font-weight: 500;
-    cursor: pointer;
-    transition: color 0.2s ease, border-color 0.2s ease;
-    border-bottom: 2px solid transparent;
-}
-
-.nm-link:hover {
-    color: #ffffff;
-}
-
-.nm-link-active {
-    color: #ffffff;
-    font-weight: 600;
-    border-bottom-color: #E50914;
-}
-
-</style>
-""",
-    unsafe_allow_html=True,
-)
+# Streamlit drops any element that is not re-emitted on a rerun, so the
+# stylesheet has to be sent every run; it lives in `styles.py` so the string
+# itself is only built once per process. st.html inserts it as raw HTML,
+# skipping the markdown parser that st.markdown would run over it.
+st.html(GLOBAL_CSS)
 
 # -------------------------------------------------
 # Top nav + main content wrapper
@@ -641,19 +460,21 @@ st.markdown(nav_html, unsafe_allow_html=True)
 st.markdown('<div class="nm-content">', unsafe_allow_html=True)
 
 # -------------------------------------------------
-# Search + fetch lists
+# Search box
 # -------------------------------------------------
-search_query = st.text_input("Search for a movie", value="", key="search_box")
+# A form only sends the query when submitted (Enter or the button), so
+# typing doesn't trigger a rerun + TMDb search per keystroke.
+with st.form("search_form", clear_on_submit=False):
+    search_query = st.text_input("Search for a movie", key="search_box")
+    submitted = st.form_submit_button("Search")
 is_searching = bool(search_query.strip())
+if submitted:
+    # Mirror the query into the URL so card links can carry it (see movie_href)
+    if is_searching:
+        st.query_params["q"] = search_query.strip()
+    else:
+        st.query_params.pop("q", None)
 
-if is_searching:
-    search_results = search_movie(search_query.strip())
-else:
-    search_results = []
-
-trending_list = get_trending()
-popular_list = get_popular()
-top_rated_list = get_top_rated()
 
 # -------------------------------------------------
 # If a movie is selected, show modal and stop drawing the rest
@@ -661,8 +482,8 @@ top_rated_list = get_top_rated()
 # -------------------------------------------------
 if st.session_state.selected_movie_id is not None:
     movie_id = st.session_state.selected_movie_id
-    details = get_movie_details(movie_id)
-    recs = get_recommendations(movie_id)
+    details = get_movie_details_with_recs(movie_id)
+    recs = details.get("recommendations", {}).get("results", [])
 
     if details:
         render_modal(details, recs)
@@ -674,60 +495,43 @@ if st.session_state.selected_movie_id is not None:
 # -------------------------------------------------
 # Main page (no modal open)
 # -------------------------------------------------
+# Searching only needs the search call; the discovery lists are fetched
+# just for the default (non-search) view.
+if is_searching:
+    search_results = search_movie(search_query.strip())
+    trending_list = popular_list = top_rated_list = []
+else:
+    search_results = []
+    trending_list, popular_list, top_rated_list = fetch_discovery_lists()
+    # Users most often click one of the first trending cards
+    prefetch_details(trending_list)
+
 hero_movie = None
 if is_searching:
     if search_results:
         hero_movie = search_results[0]
 else:
-    if trending_list:
-        hero_movie = trending_list[0]
-    elif popular_list:
-        hero_movie = popular_list[0]
-    elif top_rated_list:
-        hero_movie = top_rated_list[0]
+    hero_list = next(
+        (lst for lst in (trending_list, popular_list, top_rated_list) if lst),
+        [],
+    )
+    if hero_list:
+        hero_movie = hero_list[0]
 
 if is_searching and not search_results:
     st.info("No results found.")
 
 if is_searching and search_results:
     st.markdown(
-        render_row_html("Search Results", search_results[:12]),
+        render_row_html("Search Results", search_results, eager=EAGER_CARDS),
         unsafe_allow_html=True,
     )
-    for m in search_results[:12]:
-        if st.button(
-            f"More Info on {m.get('title', 'Untitled')} ▶",
-            key=f"open-{m['id']}",
-        ):
-            mid = m["id"]
-            st.session_state.selected_movie_id = mid
-            st.query_params = {"movie": str(mid)}
-            safe_rerun()
+    # Each card links to ?movie=<id>&q=<query>; the URL sync above opens
+    # the modal and restores the search
 
 # Show "My List" row when not searching
-if (not is_searching) and st.session_state.my_list:
-    saved_movies = []
-    for mid in st.session_state.my_list:
-        data = get_movie_details(mid)
-        if data:
-            saved_movies.append(data)
-    if saved_movies:
-        st.markdown(
-            render_row_html("My List", saved_movies),
-            unsafe_allow_html=True,
-        )
-        # Add Remove buttons beneath each poster so users can remove items directly from My List
-        # Layout uses 6 columns to match the poster grid width
-        remove_cols = st.columns(6)
-        for i, m in enumerate(saved_movies):
-            mid = m.get("id")
-            if mid is None:
-                continue
-            with remove_cols[i % 6]:
-                if st.button("Remove", key=f"remove-{mid}"):
-                    # Remove and persist immediately, then rerun to refresh UI
-                    remove_from_my_list(mid)
-                    safe_rerun()
+if not is_searching:
+    render_my_list_row()
 
 # (URL -> state sync earlier handles modal display when ?movie= is present)
 
@@ -739,11 +543,7 @@ if st.session_state.page == "my_list":
         st.write("You haven't added any movies yet.")
     else:
         # fetch details for each saved movie
-        saved_movies = []
-        for mid in st.session_state.my_list:
-            data = get_movie_details(mid)
-            if data:
-                saved_movies.append(data)
+        saved_movies = fetch_details_parallel(st.session_state.my_list)
 
         st.subheader("My List")
         st.markdown(
@@ -754,74 +554,92 @@ if st.session_state.page == "my_list":
         # optional: show remove buttons
         for m in saved_movies:
             if st.button(f"Remove {m.get('title','Untitled')}", key=f"remove_{m['id']}"):
-                st.session_state.my_list = [
-                    x for x in st.session_state.my_list if x != m["id"]
-                ]
-                save_my_list_to_disk(st.session_state.my_list)
+                remove_from_my_list(m["id"])
                 safe_rerun()
     st.markdown("</div>", unsafe_allow_html=True)
     st.stop()
 
+# Rows are collected and emitted as a single st.markdown call, so the
+# frontend parses and reconciles one element instead of one per row
+page_sections = []
+# The first row on screen loads its first posters eagerly: My List when it
+# is shown above, otherwise the first of page_sections
+first_row_eager = 0 if st.session_state.my_list else EAGER_CARDS
+
 # Hero section
 if hero_movie:
     hero_backdrop = get_backdrop_url(hero_movie)
-    hero_title = hero_movie.get("title", "Untitled")
-    hero_desc = truncate(hero_movie.get("overview", ""), 240)
+    hero_title = hero_movie["_title_html"]
+    hero_desc = hero_movie["_desc_html"]
+    hero_id = hero_movie.get("id")
+
+    # Plain link instead of st.button: ?movie= is picked up by the URL sync
+    hero_moreinfo = (
+        f'<a class="nm-btn" href="{movie_href(hero_id)}" target="_self">More Info ▶</a>'
+        if hero_id is not None
+        else ""
+    )
 
-    hero_html = (
+    st.markdown(
         '<section class="nm-hero" '
         f'style="background-image:url(\'{hero_backdrop}\');">'
         '<div class="nm-hero-gradient">'
         '<div class="nm-hero-inner">'
         f'<div class="nm-hero-title">{hero_title}</div>'
         f'<div class="nm-hero-desc">{hero_desc}</div>'
+        f"{hero_moreinfo}"
         "</div>"
         "</div>"
-        "</section>"
+        "</section>",
+        unsafe_allow_html=True,
     )
 
-    st.markdown(hero_html, unsafe_allow_html=True)
-
-    moreinfo_col, _ = st.columns([1, 5])
-    with moreinfo_col:
-        if st.button(
-            f"More Info on {hero_title} ▶",
-            key="hero_moreinfo",
-        ):
-            mid = hero_movie.get("id")
-            if mid is not None:
-                st.session_state.selected_movie_id = mid
-                st.query_params = {"movie": str(mid)}
-                safe_rerun()
-
-# Recommendations based on hero
-if hero_movie:
-    recs_for_hero = get_recommendations(hero_movie.get("id"))
-    if recs_for_hero:
-        st.markdown(
-            render_row_html(
-                "Because you watched " + hero_movie.get("title", ""),
-                recs_for_hero[:12],
-            ),
-            unsafe_allow_html=True,
+# Recommendations based on hero (skipped while searching; the search
+# results row is the focus there). If the prefetch has already fetched the
+# hero's details the row is shown straight away; otherwise the request is
+# only made once the user asks for it.
+if hero_movie and not is_searching:
+    hero_id = hero_movie.get("id")
+    prefetch = st.session_state.get("prefetched", {}).get(hero_id)
+    # Remembered per hero id, so a new hero starts collapsed again. The
+    # label is static because st.button parses Markdown in raw titles.
+    if (
+        (prefetch is not None and prefetch.done())
+        or st.session_state.get("show_recs_for") == hero_id
+        or st.button("More like this", key="show_recs_btn")
+    ):
+        st.session_state.show_recs_for = hero_id
+        # Same cached details+recommendations response the modal and the
+        # prefetch use, so no separate /recommendations request is made.
+        recs_for_hero = (
+            get_movie_details_with_recs(hero_id)
+            .get("recommendations", {})
+            .get("results", [])
         )
+        if recs_for_hero:
+            page_sections.append(
+                render_row_html(
+                    "Because you watched " + hero_movie["_title_html"],
+                    recs_for_hero,
+                    eager=first_row_eager,
+                )
+            )
+            first_row_eager = 0
 
 # Default rows when not searching
 if not is_searching:
-    if trending_list:
-        st.markdown(
-            render_row_html("Trending Now", trending_list[:12]),
-            unsafe_allow_html=True,
-        )
-    if popular_list:
-        st.markdown(
-            render_row_html("Popular on Netflix", popular_list[:12]),
-            unsafe_allow_html=True,
-        )
-    if top_rated_list:
-        st.markdown(
-            render_row_html("Top Rated", top_rated_list[:12]),
-            unsafe_allow_html=True,
-        )
+    for row_title, row_movies in (
+        ("Trending Now", trending_list),
+        ("Popular on Netflix", popular_list),
+        ("Top Rated", top_rated_list),
+    ):
+        if row_movies:
+            page_sections.append(
+                render_row_html(row_title, row_movies, eager=first_row_eager)
+            )
+            first_row_eager = 0
+
+if page_sections:
+    st.markdown("".join(page_sections), unsafe_allow_html=True)
 
 st.markdown("</div>", unsafe_allow_html=True)
@@ -1,87 +1,215 @@
 import os
+import html
 import requests
-from typing import Dict, List, Union
+import streamlit as st
+from requests.adapters import HTTPAdapter
+from functools import lru_cache, wraps
+from typing import Callable, Dict, List, Optional, Union
 from dotenv import load_dotenv
 
 load_dotenv()
 
 API_KEY = os.getenv("TMDB_API_KEY") or ""
 BASE_URL = "https://api.themoviedb.org/3"
+# Static query params, built once; requests never mutates them
+_BASE_PARAMS = {"api_key": API_KEY, "language": "en-US"}
+_PAGE_PARAMS = {**_BASE_PARAMS, "page": 1}
+_SEARCH_PARAMS = {**_PAGE_PARAMS, "include_adult": False}
+_DETAILS_PARAMS = {**_BASE_PARAMS, "append_to_response": "recommendations"}
+# Max movies kept per list endpoint (one carousel row)
+ROW_SIZE = 12
+# One pooled keep-alive session for every endpoint, so requests reuse
+# warm TCP/TLS connections instead of handshaking each time
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=2),
+)
+
+# Sized for where each image is shown: w342 posters for 180px cards, w500
+# for the modal, w1280 backdrops (w780 poster fallback) for the hero
+_IMG_W342 = "https://image.tmdb.org/t/p/w342"
+_IMG_W500 = "https://image.tmdb.org/t/p/w500"
+_IMG_W780 = "https://image.tmdb.org/t/p/w780"
+_IMG_W1280 = "https://image.tmdb.org/t/p/w1280"
+PLACEHOLDER_POSTER_URL = (
+    "https://www.themoviedb.org/assets/2/v4/logos/"
+    "stacked-blue-2b2b2b9ef3c2a132.png"
+)
+
+
+# Image URL helpers are memoized here (not in app.py, which Streamlit
+# re-executes on every rerun) so the cache lives for the whole process.
+# The endpoint functions below are cached with st.cache_data for the same
+# reason and return movies already enriched for rendering.
+@lru_cache(maxsize=4096)
+def get_poster_url_small(path: Optional[str]) -> str:
+    if path:
+        return f"{_IMG_W342}{path}"
+    return PLACEHOLDER_POSTER_URL
+
+
+@lru_cache(maxsize=1024)
+def get_poster_url_large(path: Optional[str]) -> str:
+    if path:
+        return f"{_IMG_W500}{path}"
+    return PLACEHOLDER_POSTER_URL
+
+
+@lru_cache(maxsize=4096)
+def _backdrop_url(backdrop: Optional[str], poster: Optional[str]) -> str:
+    if backdrop:
+        return f"{_IMG_W1280}{backdrop}"
+    if poster:
+        return f"{_IMG_W780}{poster}"
+    return PLACEHOLDER_POSTER_URL
+
+
+def get_backdrop_url(movie: Dict) -> str:
+    return _backdrop_url(movie.get("backdrop_path"), movie.get("poster_path"))
+
+
+def truncate(text: Optional[str], n: int = 240) -> str:
+    if not text:
+        return ""
+    if len(text) <= n:
+        return text
+    # Find the cut point first so only one slice is allocated (no rstrip copy)
+    end = n
+    while end and text[end - 1].isspace():
+        end -= 1
+    return f"{text[:end]}..."
+
+
+def enrich_movie(movie: Dict) -> Dict:
+    """Precompute the render-only fields on a movie dict.
+
+    Titles and overviews are HTML-escaped here, once per fetch, so the
+    renderers can interpolate the `_*_html` fields directly.
+    """
+    if movie:
+        movie["_poster"] = get_poster_url_small(movie.get("poster_path"))
+        movie["_year"] = (movie.get("release_date") or "")[:4]
+        overview = movie.get("overview") or ""
+        movie["_title_html"] = html.escape(movie.get("title", "Untitled"))
+        movie["_overview_html"] = html.escape(overview)
+        movie["_desc_html"] = html.escape(truncate(overview, 240))
+        genres = ", ".join(g.get("name", "") for g in movie.get("genres", []))
+        movie["_genres_html"] = html.escape(genres)
+    return movie
+
+
+def _results(data: Union[Dict, List]) -> List[Dict]:
+    # Only the first ROW_SIZE movies are ever shown, so the rest are neither
+    # enriched nor kept in the cache (which copies its value on every hit)
+    if isinstance(data, dict):
+        return [enrich_movie(m) for m in data.get("results", [])[:ROW_SIZE]]
+    return []
+
+
+class TMDbError(Exception):
+    """A TMDb request failed (network error or non-200 response)."""
 
 
-def _safe_get(url: str, params: Dict) -> Union[Dict, List]:
+def _get(url: str, params: Dict) -> Union[Dict, List]:
+    # Raises instead of returning {} so that st.cache_data, which never
+    # caches exceptions, doesn't pin a transient failure for the whole TTL
     if not API_KEY:
         return {}
     try:
-        res = requests.get(url, params=params, timeout=10)
+        res = _SESSION.get(url, params=params, timeout=10)
         if res.status_code != 200:
-            return {}
+            raise TMDbError(f"{url} returned {res.status_code}")
         return res.json()
-    except requests.RequestException:
-        return {}
+    except requests.RequestException as e:
+        raise TMDbError(str(e)) from e
+
+
+def _empty_on_error(default: Callable[[], Union[Dict, List]]):
+    """Wrap a cached endpoint so a TMDbError returns `default()` uncached."""
 
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args):
+            try:
+                return fn(*args)
+            except TMDbError:
+                return default()
 
+        return wrapper
+
+    return decorator
+
+
+@_empty_on_error(list)
+@st.cache_data(ttl=3600, show_spinner=False)
 def search_movie(query: str) -> List[Dict]:
     if not query:
         return []
     url = f"{BASE_URL}/search/movie"
-    params = {
-        "api_key": API_KEY,
-        "query": query,
-        "language": "en-US",
-        "page": 1,
-        "include_adult": False,
-    }
-    data = _safe_get(url, params)
-    if isinstance(data, dict):
-        return data.get("results", [])
-    return []
+    params = {**_SEARCH_PARAMS, "query": query}
+    data = _get(url, params)
+    return _results(data)
 
 
+@_empty_on_error(dict)
+@st.cache_data(ttl=86400, show_spinner=False)
 def get_movie_details(movie_id: Union[int, str]) -> Dict:
     if not movie_id:
         return {}
     url = f"{BASE_URL}/movie/{movie_id}"
-    params = {"api_key": API_KEY, "language": "en-US"}
-    data = _safe_get(url, params)
+    data = _get(url, _BASE_PARAMS)
     if isinstance(data, dict):
-        return data
+        return enrich_movie(data)
     return {}
 
 
+@_empty_on_error(dict)
+@st.cache_data(ttl=86400, show_spinner=False)
+def get_movie_details_with_recs(movie_id: Union[int, str]) -> Dict:
+    if not movie_id:
+        return {}
+    url = f"{BASE_URL}/movie/{movie_id}"
+    # Recommendations ride along in the same response, so opening the modal
+    # is one round-trip instead of two
+    data = _get(url, _DETAILS_PARAMS)
+    if isinstance(data, dict):
+        recs = data.get("recommendations")
+        if isinstance(recs, dict):
+            recs["results"] = _results(recs)
+        return enrich_movie(data)
+    return {}
+
+
+@_empty_on_error(list)
+@st.cache_data(ttl=86400, show_spinner=False)
 def get_recommendations(movie_id: Union[int, str]) -> List[Dict]:
     if not movie_id:
         return []
     url = f"{BASE_URL}/movie/{movie_id}/recommendations"
-    params = {"api_key": API_KEY, "language": "en-US", "page": 1}
-    data = _safe_get(url, params)
-    if isinstance(data, dict):
-        return data.get("results", [])
-    return []
+    data = _get(url, _PAGE_PARAMS)
+    return _results(data)
 
 
+@_empty_on_error(list)
+@st.cache_data(ttl=600, show_spinner=False)
 def get_trending() -> List[Dict]:
     url = f"{BASE_URL}/trending/movie/day"
-    params = {"api_key": API_KEY, "language": "en-US"}
-    data = _safe_get(url, params)
-    if isinstance(data, dict):
-        return data.get("results", [])
-    return []
+    data = _get(url, _BASE_PARAMS)
+    return _results(data)
 
 
+@_empty_on_error(list)
+@st.cache_data(ttl=600, show_spinner=False)
 def get_popular() -> List[Dict]:
     url = f"{BASE_URL}/movie/popular"
-    params = {"api_key": API_KEY, "language": "en-US", "page": 1}
-    data = _safe_get(url, params)
-    if isinstance(data, dict):
-        return data.get("results", [])
-    return []
+    data = _get(url, _PAGE_PARAMS)
+    return _results(data)
 
 
+@_empty_on_error(list)
+@st.cache_data(ttl=600, show_spinner=False)
 def get_top_rated() -> List[Dict]:
     url = f"{BASE_URL}/movie/top_rated"
-    params = {"api_key": API_KEY, "language": "en-US", "page": 1}
-    data = _safe_get(url, params)
-    if isinstance(data, dict):
-        return data.get("results", [])
-    return []
+    data = _get(url, _PAGE_PARAMS)
+    return _results(data)
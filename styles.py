@@ -0,0 +1,396 @@
+"""Global CSS for the Netflix-style UI.
+
+Kept in its own module so the stylesheet is built once per process on
+import instead of on every Streamlit rerun of `app.py`.
+"""
+
+import re
+
+
+def _minify_css(css: str) -> str:
+    """Drop comments and collapse whitespace; runs once, at import."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};])\s*", r"\1", css)
+    return css.strip()
+
+
+_GLOBAL_CSS_SRC = """
+<style>
+@import url('https://fonts.googleapis.com/css2?family=Poppins:wght@400;500;600;700&display=swap');
+
+:root {
+    --bg-page: #000;
+    --bg-nav: #141414;
+    --accent: #E50914;
+    --text-main: #fff;
+    --text-dim: #b3b3b3;
+    --row-gap: 1rem;
+    --radius-card: 8px;
+    --radius-modal: 12px;
+    --font-main: 'Poppins', sans-serif;
+}
+
+body, .stApp {
+    background-color: var(--bg-page);
+    color: var(--text-main);
+    font-family: var(--font-main);
+    margin: 0;
+    padding: 0;
+}
+
+/* NAVBAR */
+.nm-nav {
+    position: fixed;
+    top: 0;
+    left: 0;
+    right: 0;
+    height: 64px;
+    background-color: var(--bg-nav);
+    display: flex;
+    align-items: center;
+    padding: 0 2rem;
+    z-index: 1000;
+    box-shadow: 0 20px 40px rgba(0,0,0,0.8);
+}
+.nm-logo {
+    color: var(--accent);
+    font-weight: 700;
+    font-size: 1.4rem;
+    letter-spacing: -0.02em;
+    text-shadow: 0 0 20px rgba(229,9,20,0.6);
+    margin-right: 2rem;
+}
+.nm-links {
+    display: flex;
+    gap: 1.2rem;
+    font-size: 0.9rem;
+    font-weight: 500;
+}
+.nm-links div {
+    color: #e6e6e6;
+    cursor: pointer;
+}
+.nm-links div:hover {
+    color: var(--text-main);
+    text-shadow: 0 0 10px rgba(255,255,255,0.4);
+}
+
+/* CONTENT WRAPPER */
+.nm-content {
+    padding-top: 64px;
+    position: relative;
+    z-index: 1;
+}
+
+/* HERO */
+.nm-hero {
+    position: relative;
+    width: 100%;
+    height: 55vh;
+    min-height: 420px;
+    max-height: 620px;
+    background-size: cover;
+    background-position: center center;
+    display: flex;
+    align-items: flex-end;
+    box-shadow: 0 60px 120px rgba(0,0,0,0.9);
+}
+.nm-hero-gradient {
+    width: 100%;
+    height: 100%;
+    background:
+        radial-gradient(circle at 20% 30%, rgba(0,0,0,0) 0%, rgba(0,0,0,0.6) 60%),
+        linear-gradient(180deg, rgba(0,0,0,0) 0%, rgba(0,0,0,0.8) 70%, rgba(0,0,0,1) 100%);
+    display: flex;
+    align-items: flex-end;
+}
+.nm-hero-inner {
+    padding: 2rem 2rem 3rem 2rem;
+    max-width: 60%;
+    color: var(--text-main);
+    text-shadow: 0 2px 12px rgba(0,0,0,0.95);
+}
+.nm-hero-title {
+    font-size: clamp(1.8rem, 1.2vw + 1rem, 2.6rem);
+    font-weight: 700;
+    line-height: 1.15;
+    margin: 0 0 0.6rem 0;
+}
+.nm-hero-desc {
+    font-size: 0.95rem;
+    line-height: 1.5;
+    color: var(--text-dim);
+    margin: 0 0 1rem 0;
+}
+
+/* ROW / CAROUSEL */
+.nm-row {
+    margin-top: 2rem;
+    padding-left: 2rem;
+    padding-right: 2rem;
+}
+.nm-row-header {
+    color: var(--text-main);
+    font-size: 1.1rem;
+    font-weight: 600;
+    margin-bottom: 0.5rem;
+    text-shadow: 0 2px 8px rgba(0,0,0,0.8);
+}
+.nm-row-scroll {
+    display: flex;
+    flex-wrap: nowrap;
+    overflow-x: auto;
+    gap: var(--row-gap);
+    padding-bottom: 1rem;
+    scrollbar-width: thin;
+    scrollbar-color: var(--accent) rgba(255,255,255,0.05);
+}
+.nm-row-scroll::-webkit-scrollbar {
+    height: 8px;
+}
+.nm-row-scroll::-webkit-scrollbar-thumb {
+    background: var(--accent);
+    border-radius: 999px;
+}
+
+/* CARD */
+.nm-card {
+    flex: 0 0 auto;
+    width: 180px;
+    border-radius: var(--radius-card);
+    box-shadow: 0 30px 60px rgba(0,0,0,0.9);
+    transition: all 0.25s ease;
+    cursor: pointer;
+    background-color: #000;
+    position: relative;
+}
+.nm-card-inner {
+    background-color: #000;
+    border-radius: var(--radius-card);
+    overflow: hidden;
+    border: 1px solid rgba(255,255,255,0.07);
+    box-shadow: 0 18px 40px rgba(0,0,0,0.75);
+}
+.nm-card-link {
+    text-decoration: none;
+    color: inherit;
+    display: inline-block;
+}
+.nm-card:hover {
+    transform: scale(1.07);
+    box-shadow: 0 40px 120px rgba(229,9,20,0.6);
+}
+.nm-card-img {
+    width: 100%;
+    height: 260px;
+    object-fit: cover;
+    display: block;
+    background-color: #111;
+}
+.nm-card-info {
+    padding: 0.6rem 0.75rem 0.9rem 0.75rem;
+    background: linear-gradient(
+        180deg,
+        rgba(0,0,0,0) 0%,
+        rgba(0,0,0,0.7) 60%,
+        rgba(0,0,0,1) 100%
+    );
+    min-height: 70px;
+}
+.nm-card-title {
+    font-size: 0.8rem;
+    font-weight: 600;
+    color: var(--text-main);
+    line-height: 1.3;
+    text-shadow: 0 2px 6px rgba(0,0,0,0.9);
+}
+.nm-card-meta {
+    color: var(--text-dim);
+    font-size: 0.7rem;
+    margin-top: 0.25rem;
+    font-weight: 500;
+}
+
+/* MODAL */
+.nm-modal-backdrop {
+    background: rgba(0,0,0,0.8);
+    border-radius: 12px;
+    margin: 2rem auto;
+    padding: 2rem 1.5rem 2.5rem 1.5rem;
+    max-width: 960px;
+    display: flex;
+    flex-direction: column;
+    align-items: center;
+}
+.nm-modal-card {
+    width: min(900px, 90%);
+    border-radius: var(--radius-modal);
+    background:
+        radial-gradient(circle at 20% 20%, rgba(255,255,255,0.07) 0%, rgba(0,0,0,0) 60%),
+        rgba(20,20,20,0.9);
+    border: 1px solid rgba(255,255,255,0.08);
+    box-shadow: 0 60px 160px rgba(0,0,0,1);
+    display: flex;
+    flex-wrap: wrap;
+    padding: 1.5rem 1.5rem 0.5rem 1.5rem;
+    color: var(--text-main);
+}
+.nm-modal-left {
+    flex: 0 0 200px;
+    max-width: 200px;
+    margin-right: 1.5rem;
+}
+.nm-modal-poster {
+    width: 100%;
+    border-radius: var(--radius-card);
+    box-shadow: 0 30px 80px rgba(229,9,20,0.4);
+    border: 1px solid rgba(255,255,255,0.15);
+}
+.nm-modal-right {
+    flex: 1 1 auto;
+    min-width: 200px;
+}
+.nm-modal-title {
+    font-weight: 700;
+    font-size: 1.3rem;
+    line-height: 1.3;
+    color: var(--text-main);
+    text-shadow: 0 2px 8px rgba(0,0,0,0.8);
+}
+.nm-modal-year {
+    color: var(--text-dim);
+    font-weight: 500;
+    font-size: 0.9rem;
+}
+.nm-modal-stats {
+    font-size: 0.9rem;
+    color: var(--text-dim);
+    margin-top: 0.4rem;
+    margin-bottom: 0.8rem;
+}
+.nm-modal-overview {
+    font-size: 0.9rem;
+    line-height: 1.5;
+    color: #e5e5e5;
+    text-shadow: 0 2px 8px rgba(0,0,0,1);
+}
+.nm-modal-recs {
+    width: min(900px, 90%);
+    margin-top: 2rem;
+}
+
+/* Back arrow container */
+.nm-modal-back-top {
+    width: min(900px, 90%);
+    margin: 1.2rem auto 0 auto;
+    display: flex;
+    justify-content: flex-start;
+}
+.nm-modal-back-top .stButton {
+    display: inline-flex;
+}
+.nm-modal-back-top .stButton > button {
+    width: 40px;
+    height: 40px;
+    padding: 0 !important;
+    border-radius: 999px !important;
+    background: rgba(0,0,0,0.75) !important;
+    border: 1px solid rgba(255,255,255,0.25) !important;
+    font-size: 1.2rem !important;
+    font-weight: 600 !important;
+    line-height: 1 !important;
+}
+
+/* Add button under description */
+.nm-modal-add {
+    width: min(900px, 90%);
+    margin: -0.25rem auto 0 auto;
+    padding: 0 1.5rem 1.5rem 1.5rem;
+    display: flex;
+    justify-content: flex-start;
+}
+.nm-modal-add .stButton {
+    margin-left: 230px; /* ≈ poster width (200) + gap (30) */
+}
+.nm-modal-add .stButton > button {
+    background: linear-gradient(135deg, #e50914, #f40612) !important;
+    border-radius: 999px !important;
+    font-weight: 600 !important;
+    letter-spacing: 0.02em;
+}
+
+/* Search bar */
+.stTextInput > div > div > input {
+    background-color: #1a1a1a !important;
+    color: var(--text-main) !important;
+    border-radius: 6px !important;
+    border: 1px solid #333 !important;
+    padding: 10px 12px !important;
+    font-size: 0.9rem !important;
+    font-weight: 500 !important;
+    box-shadow: 0 20px 40px rgba(0,0,0,0.8);
+}
+.stTextInput > div > div > input:focus {
+    border: 1px solid var(--accent) !important;
+    outline: 2px solid var(--accent) !important;
+    box-shadow: 0 0 20px rgba(229,9,20,0.7) !important;
+}
+
+/* Global button style */
+.stButton>button {
+    background: var(--accent) !important;
+    color: #fff !important;
+    border: 0 !important;
+    border-radius: 6px !important;
+    font-weight: 600 !important;
+    padding: 0.6rem 1rem !important;
+    box-shadow: 0 20px 60px rgba(229,9,20,0.5) !important;
+    cursor: pointer !important;
+}
+.stButton>button:hover {
+    box-shadow: 0 30px 80px rgba(229,9,20,0.8) !important;
+}
+
+/* Link styled like the global button (hero "More Info") */
+.nm-btn {
+    display: inline-block;
+    background: var(--accent);
+    color: #fff !important;
+    text-decoration: none !important;
+    border-radius: 6px;
+    font-weight: 600;
+    font-size: 0.9rem;
+    padding: 0.6rem 1rem;
+    box-shadow: 0 20px 60px rgba(229,9,20,0.5);
+    text-shadow: none;
+    transition: box-shadow 0.2s ease;
+}
+.nm-btn:hover {
+    box-shadow: 0 30px 80px rgba(229,9,20,0.8);
+}
+.nm-link {
+    padding: 0 0.75rem;
+    color: #e6e6e6;
+    font-size: 0.9rem;
+    font-weight: 500;
+    cursor: pointer;
+    transition: color 0.2s ease, border-color 0.2s ease;
+    border-bottom: 2px solid transparent;
+}
+
+.nm-link:hover {
+    color: #ffffff;
+}
+
+.nm-link-active {
+    color: #ffffff;
+    font-weight: 600;
+    border-bottom-color: #E50914;
+}
+
+</style>
+"""
+
+# Sent to the browser on every rerun, so keep the payload small
+GLOBAL_CSS = _minify_css(_GLOBAL_CSS_SRC)